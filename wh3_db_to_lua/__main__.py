@@ -1,4 +1,5 @@
 import argparse
+import multiprocessing
 import sys
 import tempfile
 from pathlib import Path
@@ -65,6 +66,9 @@ def _init_cli() -> argparse.ArgumentParser:
 
 
 
+# frozen .exe: let spawned converter workers run their task instead of the CLI
+multiprocessing.freeze_support()
+
 args = _init_cli().parse_args()
 
 
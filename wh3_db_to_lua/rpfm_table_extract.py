@@ -3,9 +3,7 @@ import os
 import shutil
 import subprocess
 import tempfile
-import winreg
 from pathlib import Path
-from pprint import pprint
 from typing import NamedTuple
 
 
@@ -18,6 +16,8 @@ class RPFMDependencies(NamedTuple):
 
 
 def _get_game_data_dir() -> Path:
+    import winreg  # windows-only, needed just to locate Steam
+
     try:
         hkey = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, "SOFTWARE\Wow6432Node\Valve\Steam")
     except Exception:
@@ -65,37 +65,31 @@ def _get_rpfm_dependency_paths(rpfm_path: Path) -> RPFMDependencies:
 
 def _extract_tables(rpfm: RPFMDependencies, table_names: list[str], destination_dir_path: Path) -> list[Path]:
     with tempfile.TemporaryDirectory() as tmpdir_path:
-        file_args = ' '.join(
-            f'--file-path db/{tname}_tables/data__;{tmpdir_path}'
-            for tname in table_names
-        )
-
-        command = ' '.join([
+        argv = [
             str(rpfm.cli),
-            '--game warhammer_3',
+            '--game', 'warhammer_3',
             'pack',
             'extract',
-           f'--pack-path "{rpfm.pack}"',
-           f'--tables-as-tsv "{rpfm.schema}"',
-            file_args,
-        ])
+            '--pack-path', str(rpfm.pack),
+            '--tables-as-tsv', str(rpfm.schema),
+        ]
+
+        for tname in table_names:
+            argv += ['--file-path', f'db/{tname}_tables/data__;{tmpdir_path}']
 
-        results = subprocess.run(command, shell=True)
-        results.check_returncode()
+        subprocess.run(argv, check=True)
         
         files = []
-        for dir_path, _, file_names in os.walk(tmpdir_path):
-            for file_name in file_names:
-                if file_name.endswith('.tsv'):
-                    parent_dir = Path(dir_path)
-                    tmp_file_location = parent_dir / file_name
-                    
-                    new_file_name = f'{parent_dir.name.removesuffix("_tables")}.tsv'
-                    new_file_location = destination_dir_path / new_file_name
-
-                    shutil.move(tmp_file_location, new_file_location)
-
-                    files.append(new_file_location)
+        for tmp_file_location in Path(tmpdir_path).rglob('*.tsv'):
+            new_file_name = f'{tmp_file_location.parent.name.removesuffix("_tables")}.tsv'
+            new_file_location = destination_dir_path / new_file_name
+
+            try:
+                os.replace(tmp_file_location, new_file_location)  # plain rename, no copying
+            except OSError:
+                shutil.move(tmp_file_location, new_file_location)  # destination is on another drive
+
+            files.append(new_file_location)
     
     return files
 
@@ -151,6 +145,8 @@ def execute(rpfm_path: Path, table_names: list[str], dest: Path) -> list[Path]:
 
 
 if __name__ == '__main__':
+    from pprint import pprint
+
     args = _init_cli().parse_args()
     
     print('Tables to extract (normalized):')
@@ -1,29 +1,38 @@
 import argparse
 import glob
 import os
+import pickle
 import re 
-from hashlib import md5
+import sys
+from functools import lru_cache, partial
+from itertools import chain, repeat
 from pathlib import Path
-from pprint import pprint
-from typing import Callable, NamedTuple, Iterable, TextIO, TypeAlias
+from typing import Callable, NamedTuple, Iterable, Iterator, TextIO, TypeAlias
 
 
 LuaKeyBuilder:   TypeAlias = Callable[[int, str], str]
-LuaValueBuilder: TypeAlias = Callable[[str, int, str], str]
-LuaRowBuilder:   TypeAlias = Callable[[str], str]
-LuaTableDump:    TypeAlias = Callable[[str], str]
+LuaRowBuilder:   TypeAlias = Callable[[list[str]], 'RecordNDigest']
+LuaTableWriter:  TypeAlias = Callable[[TextIO, Iterator['RecordNDigest']], None]
 
 ValueConverter:  TypeAlias = Callable[[str], str]
 FieldConverters: TypeAlias = dict[str, ValueConverter]
+ValueConverters: TypeAlias = list[ValueConverter]    # positional, one per column
 
 
 RPFM_META_PATT = re.compile(r'^#(?P<table>[\w]+);(?P<version>[\d]+);')
 MAX_ERR_LEN: int = 1000
+MD5_PLACEHOLDER: str = '0' * 32
+MAX_WINDOWS_WORKERS: int = 61  # ProcessPoolExecutor raises ValueError above this on Windows
 
 
 class RecordNDigest(NamedTuple):
     record: str
-    digest: str
+    digest: bytes | None    # raw md5 digest of the row (md5 mode only)
+
+
+# row has a different number of fields than the table has columns
+class FieldsCountError(ValueError):
+    pass
 
 
 # ========================================================================================================================================
@@ -45,20 +54,19 @@ def execute(files: list[Path], dest: Path | None, should_replace: bool, map_colu
         _remove_source_files(files)
 
 
-def tsv_to_lua_table(tsv_file_path: Path, schema: dict|None, *, map_columns: bool, md5: bool) -> str:
-    with tsv_file_path.open() as tsv:
-        get_next_line = _file_iterator(tsv)
-
-        columns_line = get_next_line()
+def tsv_to_lua_table(tsv_file_path: Path, schema: dict|None, out: TextIO, *, map_columns: bool, md5: bool) -> None:
+    with tsv_file_path.open(encoding='utf-8', buffering=1 << 20) as tsv:
+        columns_line = next(tsv, '').rstrip('\n')
         assert columns_line, f'no columns found (empty file?): "{tsv_file_path}"'
 
-        rpfm_meta = RPFM_META_PATT.match(get_next_line())
+        rpfm_meta = RPFM_META_PATT.match(next(tsv, ''))
         assert rpfm_meta, f'invalid file format (not RPFM .tsv?): "{tsv_file_path}"'
 
 
-        build_lua_record, dump_lua_table = _get_data_builders(
+        columns = columns_line.split('\t')
+        build_lua_record, write_lua_table = _get_data_builders(
             schema=schema,
-            columns=columns_line.split('\t'),
+            columns=columns,
             table_name=rpfm_meta.group('table'),
             version=int(rpfm_meta.group('version')),
             map_columns=map_columns,
@@ -66,14 +74,18 @@ def tsv_to_lua_table(tsv_file_path: Path, schema: dict|None, *, map_columns: boo
         )
 
 
-        records = []
-        while line := get_next_line():
-            records.append(build_lua_record(line))
-
-        if not records:
-            return ''
-
-    return dump_lua_table(records)
+        # lines are stripped, filtered (blank and whitespace-only ones are skipped) and split into
+        # fields by C-level map/filter, without a Python frame per line; records are written out
+        # as soon as they are built (nothing is written for an empty table)
+        lines = filter(str.strip, map(str.rstrip, tsv, repeat('\n')))
+        rows  = map(str.split, lines, repeat('\t'))
+        try:
+            write_lua_table(out, map(build_lua_record, rows))
+        except FieldsCountError as err:
+            # rows are dumped in order, so the failed one is the first malformed row in the file;
+            # locate it only now, to keep the happy path free of line counting
+            line_no = _find_line_with_wrong_fields_count(tsv_file_path, len(columns))
+            raise FieldsCountError(f'line {line_no}: number of fields does not match number of columns ({len(columns)}): "{tsv_file_path}"') from err
 
 
 # ========================================================================================================================================
@@ -81,17 +93,11 @@ def tsv_to_lua_table(tsv_file_path: Path, schema: dict|None, *, map_columns: boo
 # ========================================================================================================================================
 
 
-def _file_iterator(tsv: TextIO) -> Callable[[], str]:
-    def _generator():
-        while line := tsv.readline():
-            yield line.strip()
-    
-    def _factory(gen):
-        def _get_next_value():
-            return next(gen, None)
-        return _get_next_value
-    
-    return _factory(_generator())
+def _find_line_with_wrong_fields_count(tsv_file_path: Path, columns_count: int) -> int | None:
+    with tsv_file_path.open(encoding='utf-8') as tsv:
+        for line_no, line in enumerate(tsv, start=1):
+            if line_no > 2 and line.strip() and line.rstrip('\n').count('\t') + 1 != columns_count:
+                return line_no
 
 
 def _get_tsv_files_in_directory(directory: Path | str) -> list[Path]:
@@ -104,24 +110,93 @@ def _get_tsv_files_in_directory(directory: Path | str) -> list[Path]:
     return [directory / Path(file) for file in glob.glob('*.tsv', root_dir=str(directory))]
 
 
-def _convert_all_files(files: list[Path], *, schema=dict|None, map_columns: bool, add_return: bool, dest: Path | None, md5: bool) -> None:
-    for file in files:
-        lua_table = tsv_to_lua_table(file, schema, map_columns=map_columns, md5=md5)
-        if add_return:
-            lua_table = f'return {lua_table}'
-        
-        directory = file.parent if dest is None else dest
+def _convert_all_files(files: list[Path], *, schema: dict|None, map_columns: bool, add_return: bool, dest: Path | None, md5: bool) -> None:
+    options = dict(map_columns=map_columns, add_return=add_return, dest=dest, md5=md5)
+
+    if len(files) < 2:
+        for file in files:
+            _convert_file(file, schema, **options)
+        return
+
+    # pool-only dependencies
+    import tempfile
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    # files are independent, so spread them over processes; the schema is handed
+    # to workers as a pickle, which is loaded once per worker by the initializer
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        schema_path = Path(tmpdir_path) / 'schema.pickle'
+        with schema_path.open('wb') as file:
+            pickle.dump(schema, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        workers = min(len(files), os.cpu_count() or 1)
+        if sys.platform == 'win32':
+            workers = min(workers, MAX_WINDOWS_WORKERS)
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_load_worker_schema, initargs=(schema_path,)) as executor:
+            convert = partial(_convert_file_in_worker, **options)
+            futures = {executor.submit(convert, file): file for file in files}
+
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as err:
+                    raise RuntimeError(f'Failed to convert file: "{futures[future]}"') from err
+
+
+def _convert_file(file: Path, schema: dict|None, *, map_columns: bool, add_return: bool, dest: Path | None, md5: bool) -> None:
+    directory = file.parent if dest is None else dest
+    lua_file_path = directory / f'{file.name.removesuffix(".tsv")}.lua'
 
-        (directory / f'{file.name.removesuffix(".tsv")}.lua').write_text(lua_table)
+    # records are streamed as they are converted: write them to a temporary file next to
+    # the target and move it into place only on success, so a failed conversion leaves
+    # neither a partial .lua file nor an unfilled checksum behind
+    tmp_file_path = lua_file_path.with_name(f'.{lua_file_path.name}.{os.getpid()}.tmp')
+    try:
+        with tmp_file_path.open('w', encoding='utf-8', newline='\n', buffering=1 << 20) as lua_file:
+            if add_return:
+                lua_file.write('return ')
+
+            tsv_to_lua_table(file, schema, lua_file, map_columns=map_columns, md5=md5)
+
+        os.replace(tmp_file_path, lua_file_path)
+    except BaseException:
+        tmp_file_path.unlink(missing_ok=True)
+        raise
+
+
+_worker_schema: dict | None = None
+
+
+def _load_worker_schema(schema_path: Path) -> None:
+    global _worker_schema
+    with schema_path.open('rb') as file:
+        _worker_schema = pickle.load(file)
+
+
+def _convert_file_in_worker(file: Path, **options) -> None:
+    _convert_file(file, _worker_schema, **options)
 
 
 def _remove_source_files(files: list[Path]) -> None:
     for file in files:
-        file.unlink(missing_ok=True)
+        try:
+            os.unlink(file)
+        except FileNotFoundError:
+            pass
 
 
-def _get_hex_digest(s: str) -> str:
-    return md5(s.encode(), usedforsecurity=False).hexdigest()
+def _md5_getter_factory() -> Callable:
+    from hashlib import md5  # imported only when checksums are requested
+
+    def _get_md5(chunks: Iterable[bytes]):
+        # same as hashing b''.join(chunks), without building the joined bytes
+        h = md5(usedforsecurity=False)
+        for chunk in chunks:
+            h.update(chunk)
+        return h
+
+    return _get_md5
 
 
 # ========================================================================================================================================
@@ -129,17 +204,17 @@ def _get_hex_digest(s: str) -> str:
 # ========================================================================================================================================
 
 
-def _get_data_builders(schema: dict|None, columns: list[str], table_name: str, version: int, map_columns: bool, md5: bool) -> tuple[LuaRowBuilder, LuaTableDump]:
+def _get_data_builders(schema: dict|None, columns: list[str], table_name: str, version: int, map_columns: bool, md5: bool) -> tuple[LuaRowBuilder, LuaTableWriter]:
     key_builder    = _key_builder_factory(map_columns)
-    value_builder  = _build_value_from_rust_types__factory(schema, table_name, version)
-    if not value_builder:
+    converters     = _get_rust_types_converters(schema, table_name, version, columns)
+    if not converters:
         print("Fallback to manual type determination (may be inaccurate)")
-        value_builder = _build_value_legacy
+        converters = _get_legacy_converters(columns)
 
-    record_builder = _record_dumper_factory(key_builder, value_builder, columns=columns, calculate_md5=md5)
-    table_dumper   = _table_dumper_factory(calculate_md5=md5)
+    record_builder = _record_dumper_factory(key_builder, converters, columns=columns, calculate_md5=md5)
+    table_writer   = _table_writer_factory(calculate_md5=md5)
 
-    return record_builder, table_dumper
+    return record_builder, table_writer
 
 
 
@@ -153,56 +228,73 @@ def _key_builder_factory(map_columns: bool) -> LuaKeyBuilder:
     return _build_normal_key if map_columns else _build_indexed_key
 
 
-def _table_dumper_factory(calculate_md5: bool) -> LuaTableDump:
-    def _dump_records(records: list[RecordNDigest], delim: str) -> str:
-        return delim.join(
-            f'[{i}] = {record}'
-            for i, (record, _) in enumerate(records, start=1)
-        )
+def _table_writer_factory(calculate_md5: bool) -> LuaTableWriter:
+    get_md5 = _md5_getter_factory() if calculate_md5 else None
 
-    def _form_default_lua_table(records: list[RecordNDigest]) -> str:
-        dumped_records = _dump_records(records, delim=',\n  ')
-        return f'{{\n  {dumped_records}\n}}'
+    def _write_records(out: TextIO, records: Iterable[RecordNDigest], delim: str, digests: list[bytes] | None = None) -> None:
+        # row digests are collected only when a list for them is given (md5 mode)
+        write = out.write
+        for i, (record, digest) in enumerate(records, start=1):
+            if i > 1:
+                write(delim)
+            write(f'[{i}] = {record}')
+            if digests is not None:
+                digests.append(digest)
 
-    def _form_lua_table_with_md5(records: list[tuple[str, int]]) -> str:
-        dumped_records = _dump_records(records, delim=',\n    ')
-        stable_agg_checksum = _get_hex_digest(''.join(sorted(digest for _, digest in records)))
+    def _write_default_lua_table(out: TextIO, records: Iterator[RecordNDigest]) -> None:
+        if not (first := next(records, None)):
+            return
 
-        return f'{{\n  ["checksum"]="{stable_agg_checksum}",\n  ["records"]={{\n    {dumped_records}\n  }}\n}}'
+        out.write('{\n  ')
+        _write_records(out, chain((first,), records), delim=',\n  ')
+        out.write('\n}')
 
+    def _write_lua_table_with_md5(out: TextIO, records: Iterator[RecordNDigest]) -> None:
+        if not (first := next(records, None)):
+            return
 
-    return _form_lua_table_with_md5 if calculate_md5 else _form_default_lua_table
+        # checksum is known only after all records are written, but md5 hex digest has
+        # a fixed width: reserve its place now and fill it in at the end
+        out.write('{\n  ["checksum"]="')
+        checksum_pos = out.tell()
+        out.write(f'{MD5_PLACEHOLDER}",\n  ["records"]={{\n    ')
 
+        digests = []
+        _write_records(out, chain((first,), records), delim=',\n    ', digests=digests)
+        out.write('\n  }\n}')
 
+        # raw digests sort in the same order as their hex forms, so this is still
+        # md5 over the sorted and concatenated hex digests of the rows
+        stable_agg_checksum = get_md5(digest.hex().encode('ascii') for digest in sorted(digests)).hexdigest()
+        end_pos = out.tell()
+        out.seek(checksum_pos)
+        out.write(stable_agg_checksum)
+        out.seek(end_pos)
 
-def _record_dumper_factory(build_key: LuaKeyBuilder, build_value: LuaValueBuilder, *, columns: list[str], calculate_md5: bool) -> Callable[[str], RecordNDigest]:
-    def _dump_as_lua_table(fields: list[str]) -> str:
-        lua_table_kv = [
-            '{k}={v}'.format(
-                k=build_key(i, column),
-                v=build_value(field, i, column),
-            )
-            for i, (column, field) in enumerate(zip(columns, fields), start=1)
-        ]
 
-        return '{%s}' % (','.join(lua_table_kv))
+    return _write_lua_table_with_md5 if calculate_md5 else _write_default_lua_table
 
-    
 
-    def dump_record(tsv_line: str) -> RecordNDigest:
-        dumped_lua_table = _dump_as_lua_table(tsv_line.split('\t'))
-        return RecordNDigest(dumped_lua_table, None)
+
+def _record_dumper_factory(build_key: LuaKeyBuilder, converters: ValueConverters, *, columns: list[str], calculate_md5: bool) -> LuaRowBuilder:
+    # keys are the same for every row, so build them (with '=' suffix) only once
+    keys = [f'{build_key(i, column)}=' for i, column in enumerate(columns, start=1)]
+
+    _dump_as_lua_table = _compile_lua_table_dumper(keys, converters)
+    get_md5 = _md5_getter_factory() if calculate_md5 else None
+
+    def dump_record(fields: list[str]) -> RecordNDigest:
+        return RecordNDigest(_dump_as_lua_table(fields), None)
 
 
     def to_str(field) -> str:
         return str(to_lua_num(field) if is_float(field) else field)
 
-    def dump_record_and_calc_md5(tsv_line: str) -> RecordNDigest:
-        fields = tsv_line.split('\t')
+    def dump_record_and_calc_md5(fields: list[str]) -> RecordNDigest:
         dumped_lua_table = _dump_as_lua_table(fields)
 
-        sorted_fields = ''.join(sorted(to_str(f) for f in fields))
-        digest = _get_hex_digest(sorted_fields)
+        # utf-8 bytes sort in the same order as their str counterparts
+        digest = get_md5(sorted(to_str(f).encode() for f in fields)).digest()
 
         return RecordNDigest(dumped_lua_table, digest)
     
@@ -210,47 +302,91 @@ def _record_dumper_factory(build_key: LuaKeyBuilder, build_value: LuaValueBuilde
     return dump_record_and_calc_md5 if calculate_md5 else dump_record
 
 
+# Generates a row dumper specialized for the table, so each row is a single straight-line expression:
+#
+#   def _dump_as_lua_table(fields):
+#       try:
+#           f0, f1, f2, = fields
+#       except ValueError:
+#           raise FieldsCountError(...) from None
+#       return ''.join(('{[1]=[=[', f0, ']=],[2]=', f1, ',[3]=', _c2(f2), '}'))
+#
+# pass-through and string converters are inlined, the rest are called by name
+def _compile_lua_table_dumper(keys: list[str], converters: ValueConverters) -> Callable[[list[str]], str]:
+    namespace = {'FieldsCountError': FieldsCountError}
+    fields = [f'f{i}' for i in range(len(keys))]
+
+    parts, literal = [], '{'
+    for i, (field, key, convert) in enumerate(zip(fields, keys, converters)):
+        literal += (',' if i else '') + key
+
+        if convert is to_lua_str:
+            parts += [repr(literal + '[=['), field]
+            literal = ']=]'
+            continue
 
-# ========================================================================================================================================
-#                                       LEGACY dump tsv field using some assumptions (May be inaccurate)
-# ========================================================================================================================================
+        if convert is _ret_same_val:
+            parts += [repr(literal), field]
+        else:
+            namespace[f'_c{i}'] = convert
+            parts += [repr(literal), f'_c{i}({field})']
+        literal = ''
+
+    parts.append(repr(literal + '}'))
+
+    source = (
+         'def _dump_as_lua_table(fields):\n'
+         '    try:\n'
+        f'        {", ".join(fields)}, = fields\n'
+         '    except ValueError:\n'
+        f'        raise FieldsCountError(f"expected {len(fields)} fields, got {{len(fields)}}") from None\n'
+        f'    return \'\'.join(({", ".join(parts)}))\n'
+    )
+    exec(source, namespace)
+
+    return namespace['_dump_as_lua_table']
 
 
-def _match_type(pattern) -> Callable[[str], re.Match|None]:
-    pat = re.compile(pattern)
-    def check(v): return pat.match(v)
-    return check
 
+# ========================================================================================================================================
+#                                       LEGACY dump tsv field using some assumptions (May be inaccurate)
+# ========================================================================================================================================
 
-is_int     = _match_type(r'^-?[\d]+?$')
-is_float   = _match_type(r'^(?P<int>-?[\d]+)\.(?P<fraction>[\d]+)$')
-is_float   = _match_type(r'^(?P<int>-?[\d]+)\.(?P<fraction>[\d]+)$')
 
-is_boolean = _match_type(r'^true$|^false$')
+is_float   = re.compile(r'^(?P<int>-?[\d]+)\.(?P<fraction>[\d]+)$').match  # md5 path only
 
 str_val = '[=[{v}]=]'
 
+_LEGACY_TYPE_RE = re.compile(r'^(?:(?P<bool>true|false)|(?P<int_val>-?[\d]+)|(?P<int>-?[\d]+)\.(?P<fraction>[\d]+))$')
+_match_legacy_type = _LEGACY_TYPE_RE.match
+_LEGACY_NON_STR_START = frozenset('-0123456789tf')  # first chars of anything _LEGACY_TYPE_RE can match
+
 
 def _get_shortest_number_repr(match: re.Match) -> str:
-    if int(match.group('fraction')) == 0:
+    fraction = match.group('fraction').rstrip('0')
+    if not fraction:
         return match.group('int')
-    return str(float(match.string))
+    return f"{match.group('int')}.{fraction}"
 
 
-def _build_value_legacy(value: str, pos: int, column: str) -> str:
-    if pos == 1: 
+def _build_value_legacy(value: str) -> str:
+    # most fields are plain strings: a first char check lets them skip the regex
+    if not value or value[0] not in _LEGACY_NON_STR_START:
         return str_val.format(v=value)
-    
-    if is_boolean(value):
-        return value
-    
-    if is_int(value):
-        return value
 
-    if match := is_float(value):
+    match = _match_legacy_type(value)
+    if not match:
+        return str_val.format(v=value)
+
+    if match.lastgroup == 'fraction':
         return _get_shortest_number_repr(match)
-    
-    return str_val.format(v=value)
+
+    return value  # boolean or integer
+
+
+def _get_legacy_converters(columns: list[str]) -> ValueConverters:
+    # first column is a key, so it is always treated as a string
+    return [to_lua_str] + [_build_value_legacy] * (len(columns) - 1)
 
 
 
@@ -266,13 +402,20 @@ to_lua_bool:   ValueConverter = _ret_same_val
 to_lua_str:    ValueConverter = lambda v: f'[=[{v}]=]'
 to_lua_num:    ValueConverter = lambda v: str(_get_shortest_repr_without_trailing_zeros(v))
 
+# RPFM writes numbers in plain fixed notation, so those can be normalized on the string level;
+# any other value goes through to_lua_num as before (it raises on empty cells and garbage)
+_is_plain_float = re.compile(r'-?[0-9]+\.[0-9]+', re.ASCII).fullmatch
+
+to_lua_int:    ValueConverter = lambda v: v if _is_plain_int(v) else to_lua_num(v)
+to_lua_float:  ValueConverter = lambda v: _trim_fraction_zeros(v) if _is_plain_int(v) or _is_plain_float(v) else to_lua_num(v)
+
 
 RUST_TYPE_TO_LUA: dict[str, ValueConverter] = {
     'Boolean':          to_lua_bool,
     'ColourRGB':        to_lua_str,   # something like: FFFFFF
-    'F32':              to_lua_num,
+    'F32':              to_lua_float,
     'F64':              to_lua_str,
-    'I32':              to_lua_num,
+    'I32':              to_lua_int,
     'I64':              to_lua_str,
     'OptionalStringU8': to_lua_str,
     'StringU8':         to_lua_str,
@@ -281,19 +424,34 @@ RUST_TYPE_TO_LUA: dict[str, ValueConverter] = {
 
 
 
+def _is_plain_int(v: str) -> bool:
+    digits = v[1:] if v[:1] == '-' else v
+    return digits.isascii() and digits.isdigit()
+
+
+def _trim_fraction_zeros(v: str) -> str:
+    return (v.rstrip('0').rstrip('.') or '0') if '.' in v else v
+
+
 def _get_shortest_repr_without_trailing_zeros(v):
     f = float(v); i = int(f)
     return i if i == f else f
 
 
+@lru_cache(maxsize=1)
 def _get_rpfm_db_schema() -> dict | None:
     schemas_path = Path(os.getenv('APPDATA')) / 'rpfm/config/schemas/schema_wh3.ron'
     if not schemas_path.exists():
         print(f'Failed to get WH3 schema at path: "{schemas_path}"')
         return
     
-    with schemas_path.open(encoding='utf-8') as file:
-        prepared_schema_content = file.read().replace(r"\'", r'\"').replace(r'\u', r'\n')
+    cache_path = schemas_path.with_suffix('.pickle')
+    if (schema := _load_cached_schema(cache_path, source_path=schemas_path)) is not None:
+        return schema
+
+    # patch raw bytes and decode once, instead of running str.replace over the decoded text
+    with schemas_path.open('rb') as file:
+        prepared_schema_content = file.read().replace(rb"\'", rb'\"').replace(rb'\u', rb'\n').decode('utf-8')
     
     try:
         import pyron
@@ -303,10 +461,30 @@ def _get_rpfm_db_schema() -> dict | None:
         print(f'Failed to load RON (RustObjectNotation) file:\n{err}')
         return
     
+    _dump_cached_schema(schema, cache_path)
     return schema
 
 
-def _build_value_from_rust_types__factory(schema: dict|None, table_name: str, version: int) -> LuaValueBuilder|None:
+def _load_cached_schema(cache_path: Path, source_path: Path) -> dict | None:
+    try:
+        if cache_path.stat().st_mtime <= source_path.stat().st_mtime:
+            return  # outdated (RPFM updated its schema)
+
+        with cache_path.open('rb') as file:
+            return pickle.load(file)
+    except Exception:
+        return
+
+
+def _dump_cached_schema(schema: dict, cache_path: Path) -> None:
+    try:
+        with cache_path.open('wb') as file:
+            pickle.dump(schema, file, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as err:
+        print(f'Failed to cache parsed schema at path "{cache_path}": {err}')
+
+
+def _get_rust_types_converters(schema: dict|None, table_name: str, version: int, columns: list[str]) -> ValueConverters|None:
     if not schema:
         return print("No schema provided")
     
@@ -314,12 +492,10 @@ def _build_value_from_rust_types__factory(schema: dict|None, table_name: str, ve
     if not converters:
         return print("Failed to build converters")
     
-    def _dump_value(value: str, pos: int, column: str) -> str:
-        converter = converters.get(column)
-        assert converter, f"wtf!?: converters.get('{column}') = None"
-        return converter(value)
+    if missing := [column for column in columns if column not in converters]:
+        return print(f'Columns not found in schema definition: {missing}')
 
-    return _dump_value
+    return [converters[column] for column in columns]
 
 
 def _get_rust_type(field_definition: dict) -> str:
@@ -437,6 +613,8 @@ def _init_cli() -> argparse.ArgumentParser:
 
 
 if __name__ == '__main__':
+    from pprint import pprint
+
     args = _init_cli().parse_args()
 
     files = args.file if args.file else _get_tsv_files_in_directory(args.directory)